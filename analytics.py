@@ -4,15 +4,41 @@ CSVLogger appends to trade_history.csv for pivot tables and forecasting.
 Logs passive limit order fills (market making).
 """
 
-import csv
+import atexit
+import os
 import threading
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Optional
 
 # Default filename (gitignored)
 DEFAULT_CSV_PATH = "trade_history.csv"
 
+# SPSC ring buffer capacity (power of two so indexing is a mask).
+_RING_SIZE = 4096
+_RING_MASK = _RING_SIZE - 1
+
+# Timestamp cache: events within the same wall-clock second reuse one string,
+# so bursts of fills skip the strftime state machine entirely.
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
+def _fmt_ts(ts_ns: int) -> str:
+    global _last_ts_sec, _last_ts_str
+    s = ts_ns // 1_000_000_000
+    if s != _last_ts_sec:
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(s))
+        _last_ts_sec = s
+    return _last_ts_str
+
+
+# Result column encoded as a small int on the producer side; the writer
+# thread resolves it to the CSV string.
+_RESULT_STR = ("PLACED", "FILLED", "Win", "Loss", "UNKNOWN")
+_PLACED, _FILLED, _WIN, _LOSS, _UNKNOWN = range(5)
+
+
 CSV_HEADERS = [
     "Timestamp",
     "Market_ID",
@@ -36,20 +62,77 @@ class CSVLogger:
         self._path = Path(filepath or DEFAULT_CSV_PATH)
         self._lock = threading.Lock()
         self._cumulative_pnl: float = 0.0
+        # Rows are already ASCII bytes by the time they hit disk, so write
+        # through a raw O_APPEND descriptor and skip the BufferedWriter/
+        # TextIOWrapper stack (and its per-write lock) entirely.
+        self._fd: Optional[int] = os.open(
+            self._path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
         self._ensure_header()
+        # Rows flow through a single-producer/single-consumer ring buffer
+        # (bot loop -> writer thread). Under the GIL the integer head/tail
+        # stores are atomic, so the hot enqueue path needs no lock at all.
+        self._ring: list = [None] * _RING_SIZE
+        self._head = 0  # next slot the producer writes
+        self._tail = 0  # next slot the consumer reads
+        self._closed = False
+        self._writer_thread = threading.Thread(target=self._drain, daemon=True)
+        self._writer_thread.start()
+        atexit.register(self.close)
 
     def _ensure_header(self) -> None:
         with self._lock:
-            if not self._path.exists():
-                with open(self._path, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    writer.writerow(CSV_HEADERS)
-
-    def _append_row(self, row: dict) -> None:
+            if os.fstat(self._fd).st_size == 0:
+                self._write_bytes((",".join(CSV_HEADERS) + "\r\n").encode("ascii"))
+
+    def _append(self, record: tuple) -> None:
+        # Back-pressure instead of dropping rows if the writer ever lags by
+        # a full ring (never expected at trade-log rates).
+        while self._head - self._tail >= _RING_SIZE:
+            time.sleep(0.001)
+        self._ring[self._head & _RING_MASK] = record
+        self._head += 1
+
+    def _drain(self) -> None:
+        """Writer thread: format and drain records in batches, one flush per batch."""
+        while True:
+            if self._tail == self._head:
+                if self._closed:
+                    return
+                time.sleep(0.001)
+                continue
+            batch = []
+            while self._tail != self._head and len(batch) < 256:
+                idx = self._tail & _RING_MASK
+                ts, mkt, out, sp, sz, rc, pnl, cpnl = self._ring[idx]
+                self._ring[idx] = None
+                self._tail += 1
+                batch.append(
+                    f"{_fmt_ts(ts)},{mkt},{out},{sp:.4f},{sz:.2f},"
+                    f"PASSIVE_MM,{_RESULT_STR[rc]},{pnl:.2f},{cpnl:.2f}\r\n"
+                )
+            self._write_batch(batch)
+
+    def _write_bytes(self, payload: bytes) -> None:
+        # os.write may return a short count; loop until the payload lands.
+        while payload:
+            n = os.write(self._fd, payload)
+            payload = payload[n:]
+
+    def _write_batch(self, batch: list) -> None:
+        with self._lock:
+            if self._fd is not None:
+                self._write_bytes("".join(batch).encode("ascii"))
+
+    def close(self) -> None:
+        """Drain pending rows, then close the underlying CSV file."""
+        self._closed = True
+        if self._writer_thread.is_alive():
+            self._writer_thread.join(timeout=3)
         with self._lock:
-            with open(self._path, "a", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
-                writer.writerow({k: row.get(k, "") for k in CSV_HEADERS})
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
 
     def log_order_placed(
         self,
@@ -59,18 +142,8 @@ class CSVLogger:
         size: float,
     ) -> None:
         """Log when a passive limit order is placed (pre-fill)."""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-        self._append_row({
-            "Timestamp": timestamp,
-            "Market_ID": str(market_id),
-            "Outcome": outcome,
-            "Share_Price_Bought": f"{share_price:.4f}",
-            "Size": f"{size:.2f}",
-            "Order_Type": "PASSIVE_MM",
-            "Result": "PLACED",
-            "PnL": "0.00",
-            "Cumulative_PnL": f"{self._cumulative_pnl:.2f}",
-        })
+        self._append((time.time_ns(), str(market_id), outcome, share_price, size,
+                      _PLACED, 0.0, self._cumulative_pnl))
 
     def log_passive_fill(
         self,
@@ -82,18 +155,8 @@ class CSVLogger:
         """
         Log when a passive limit order is filled (market making).
         """
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-        self._append_row({
-            "Timestamp": timestamp,
-            "Market_ID": str(market_id),
-            "Outcome": outcome,
-            "Share_Price_Bought": f"{share_price:.4f}",
-            "Size": f"{size:.2f}",
-            "Order_Type": "PASSIVE_MM",
-            "Result": "FILLED",
-            "PnL": "0.00",
-            "Cumulative_PnL": f"{self._cumulative_pnl:.2f}",
-        })
+        self._append((time.time_ns(), str(market_id), outcome, share_price, size,
+                      _FILLED, 0.0, self._cumulative_pnl))
 
     def log_market_resolved(
         self,
@@ -108,28 +171,17 @@ class CSVLogger:
         """
         if result_yes_won is True:
             pnl = size * (1.0 - share_price_bought)
-            result_str = "Win"
+            result_code = _WIN
         elif result_yes_won is False:
             pnl = -size * share_price_bought
-            result_str = "Loss"
+            result_code = _LOSS
         else:
             pnl = 0.0
-            result_str = "UNKNOWN"
+            result_code = _UNKNOWN
 
         self._cumulative_pnl += pnl
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-
-        self._append_row({
-            "Timestamp": timestamp,
-            "Market_ID": str(market_id),
-            "Outcome": "Yes",
-            "Share_Price_Bought": f"{share_price_bought:.4f}",
-            "Size": f"{size:.2f}",
-            "Order_Type": "PASSIVE_MM",
-            "Result": result_str,
-            "PnL": f"{pnl:.2f}",
-            "Cumulative_PnL": f"{self._cumulative_pnl:.2f}",
-        })
+        self._append((time.time_ns(), str(market_id), "Yes", share_price_bought, size,
+                      result_code, pnl, self._cumulative_pnl))
 
         return pnl
 
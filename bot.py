@@ -4,14 +4,18 @@ Polymarket Passive Market Making Bot.
 24/7 liquidity provision on markets with rewards. Symmetrical quotes around mid_price.
 """
 
+import asyncio
 import sys
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from typing import Optional
 
 from rich.console import Console
 from rich.live import Live
 
+from py_clob_client.clob_types import BalanceAllowanceParams, AssetType
+
 from config import POSITION_SIZE_USD, CIRCUIT_BREAKER_LOSS_USD
 from dashboard import create_dashboard, format_time_left
 from order_book_feed import OrderBookFeed
@@ -24,6 +28,9 @@ from logger import setup_logging
 from analytics import CSVLogger
 import logging
 
+import requests
+from requests.adapters import HTTPAdapter
+
 try:
     from web3 import Web3
     WEB3_AVAILABLE = True
@@ -35,8 +42,25 @@ logger = logging.getLogger(__name__)
 
 POLYGON_RPC = "https://polygon-rpc.com"
 
+# Single Web3 instance so the underlying HTTP session keeps its TCP/TLS
+# connection alive across balance polls.
+_w3 = None
+
+
+def _get_w3():
+    global _w3
+    if _w3 is None and WEB3_AVAILABLE:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        _w3 = Web3(Web3.HTTPProvider(
+            POLYGON_RPC,
+            request_kwargs={"timeout": 5},
+            session=session,
+        ))
+    return _w3
 
-@dataclass
+
+@dataclass(slots=True)
 class BotState:
     market: Optional[ActiveMarket] = None
     mid_price: Optional[float] = None
@@ -44,26 +68,52 @@ class BotState:
     usdc_balance: Optional[float] = None
     pol_balance: Optional[float] = None
     circuit_breaker: bool = False
-    pnl_history: List[float] = field(default_factory=list)
+    pnl_history: deque = field(default_factory=lambda: deque(maxlen=48))
+
+
+# The CLOB returns the same response shape every time in steady state.
+# Discover which field holds the balance once, then take the direct path.
+_bal_path: Optional[tuple] = None
+
+_USDC_KEYS = ("balance", "allowance", "balanceAllowance", "available")
+
+# Built once; the params never change between refreshes.
+_BALANCE_PARAMS = BalanceAllowanceParams(asset_type=AssetType.COLLATERAL)
+
+
+def _try_float(v) -> Optional[float]:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
 
 
 def fetch_usdc_balance(client) -> Optional[float]:
+    global _bal_path
     try:
-        from py_clob_client.clob_types import BalanceAllowanceParams, AssetType
-        params = BalanceAllowanceParams(asset_type=AssetType.COLLATERAL)
-        resp = client.get_balance_allowance(params)
-        if resp and isinstance(resp, dict):
-            for key in ("balance", "allowance", "balanceAllowance", "available"):
-                if key in resp:
-                    v = resp[key]
-                    if isinstance(v, (int, float)):
-                        return float(v)
-                    if isinstance(v, str) and v.replace(".", "").replace("-", "").replace(".", "", 1).isdigit():
-                        return float(v)
-            if "balances" in resp:
-                for b in resp["balances"]:
-                    if isinstance(b, dict) and b.get("currency", "").upper() in ("USD", "USDC"):
-                        return float(b.get("currentBalance", b.get("balance", 0)) or 0)
+        resp = client.get_balance_allowance(_BALANCE_PARAMS)
+        if not resp or not isinstance(resp, dict):
+            return None
+        if _bal_path is not None:
+            try:
+                v = resp
+                for k in _bal_path:
+                    v = v[k]
+                return float(v)
+            except (KeyError, IndexError, TypeError, ValueError):
+                _bal_path = None  # schema changed; rediscover below
+        for key in _USDC_KEYS:
+            if key in resp:
+                v = _try_float(resp[key])
+                if v is not None:
+                    _bal_path = (key,)
+                    return v
+        if "balances" in resp:
+            for i, b in enumerate(resp["balances"]):
+                if isinstance(b, dict) and b.get("currency", "").upper() in ("USD", "USDC"):
+                    bkey = "currentBalance" if "currentBalance" in b else "balance"
+                    _bal_path = ("balances", i, bkey)
+                    return float(b.get(bkey, 0) or 0)
         return None
     except Exception as e:
         logger.debug("Balance fetch failed: %s", e)
@@ -74,7 +124,7 @@ def fetch_pol_balance(address: str) -> Optional[float]:
     if not WEB3_AVAILABLE or not address:
         return None
     try:
-        w3 = Web3(Web3.HTTPProvider(POLYGON_RPC))
+        w3 = _get_w3()
         return w3.from_wei(w3.eth.get_balance(address), "ether")
     except Exception:
         return None
@@ -99,7 +149,11 @@ def run_bot():
     feed: Optional[OrderBookFeed] = None
     last_pnl_sample_time = 0.0
     pnl_sample_interval = 10.0
-    last_trade_ids: Set[str] = set()
+    balance_refresh_interval = 30.0
+    # Seen trade IDs as a bounded LRU: evicting one-at-a-time preserves
+    # recency, unlike the old set + .clear() which forgot every recent ID
+    # at once and re-processed fills right after each flush.
+    last_trade_ids: OrderedDict = OrderedDict()
 
     def update_balances():
         state.usdc_balance = fetch_usdc_balance(client)
@@ -125,7 +179,6 @@ def run_bot():
     console.print("[green]Order book feed started.[/green]")
 
     strategy_check_interval = 3.0
-    last_strategy_check = 0.0
     dashboard_refresh = 0.5
 
     def get_dashboard_state():
@@ -146,9 +199,32 @@ def run_bot():
             "pnl_history": state.pnl_history,
         }
 
+    # Rebuilding the Rich panel tree isn't free; reuse the last renderable
+    # when nothing on the dashboard actually changed.
+    last_render_sig = None
+    last_render_panel = None
+
     def render():
+        nonlocal last_render_sig, last_render_panel
         s = get_dashboard_state()
-        return create_dashboard(
+        sig = (
+            s["market_name"],
+            s["market_time_left"],
+            s["mid_price"],
+            s["active_yes_bid"],
+            s["active_no_bid"],
+            s["inventory_yes"],
+            s["inventory_no"],
+            s["session_pnl"],
+            s["usdc_balance"],
+            s["pol_balance"],
+            s["circuit_breaker"],
+            tuple(s["pnl_history"]),
+        )
+        if sig == last_render_sig and last_render_panel is not None:
+            return last_render_panel
+        last_render_sig = sig
+        last_render_panel = create_dashboard(
             market_name=s["market_name"],
             market_time_left=s["market_time_left"],
             mid_price=s["mid_price"],
@@ -162,111 +238,177 @@ def run_bot():
             circuit_breaker=s["circuit_breaker"],
             pnl_history=s["pnl_history"],
         )
-
-    try:
-        with Live(render(), console=console, refresh_per_second=2) as live:
-            while True:
-                time.sleep(dashboard_refresh)
-                now = time.monotonic()
-
-                if manager.circuit_breaker_tripped:
-                    state.circuit_breaker = True
-                    live.update(render())
-                    console.print("[bold red]CIRCUIT BREAKER: Bot stopped.[/bold red]")
-                    break
-
-                state.mid_price = feed.mid_price
-                state.session_pnl = manager.session_pnl
-
-                if now - last_pnl_sample_time >= pnl_sample_interval:
-                    last_pnl_sample_time = now
-                    state.pnl_history.append(state.session_pnl)
-                    if len(state.pnl_history) > 48:
-                        state.pnl_history = state.pnl_history[-48:]
-
-                # Re-scan market periodically (in case we need to switch)
-                if int(now) % 60 < 2:
-                    m = scanner.get_active_market()
-                    if m and m.market_id != (state.market.market_id if state.market else ""):
-                        state.market = m
-                        manager.cancel_all_orders()
-                        if feed:
-                            feed.stop()
-                        feed = OrderBookFeed(m.yes_token_id, m.no_token_id)
-                        feed.start()
-                        logger.info("Switched to market: %s", m.question)
-
-                # Mid-price drift: cancel and re-quote
-                if state.mid_price is not None and manager.should_requote(state.mid_price):
-                    manager.cancel_all_orders()
-                    manager.set_last_mid(state.mid_price)
-                    logger.info("Mid drifted, re-quoting at %.3f", state.mid_price)
-
-                # Strategy: place symmetrical quotes
-                if now - last_strategy_check >= strategy_check_interval and state.market:
-                    last_strategy_check = now
-                    if (
-                        state.mid_price
-                        and state.market.accepting_orders
-                        and not state.circuit_breaker
-                    ):
-                        manager.set_last_mid(state.mid_price)
-                        size = round(POSITION_SIZE_USD / max(state.mid_price, 0.1), 2)
-                        quotes = strategy.get_quotes(
-                            state.mid_price,
-                            state.market.yes_token_id,
-                            state.market.no_token_id,
-                            size=min(size, 20),
-                            quote_yes=manager.can_quote_yes(),
-                            quote_no=manager.can_quote_no(),
+        return last_render_panel
+
+    # Event-driven main loop: each concern runs as its own coroutine on its
+    # own period, so a slow RPC (balances, trade poll, rescans) never stalls
+    # dashboard refresh or quoting. Blocking SDK calls go through to_thread.
+    stop: Optional[asyncio.Event] = None
+
+    async def pause(seconds: float) -> None:
+        """Sleep that wakes immediately when the bot is stopping."""
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def every(period: float):
+        """Drift-free periodic ticks: each deadline advances by exactly
+        `period`, so slow work in one cycle doesn't shift later ones. If a
+        cycle overruns its deadline the missed ticks are skipped, not burst."""
+        next_at = time.monotonic() + period
+        while True:
+            await pause(max(0.0, next_at - time.monotonic()))
+            if stop.is_set():
+                return
+            yield
+            next_at += period
+            now = time.monotonic()
+            if next_at < now:
+                next_at = now + period
+
+    async def rescan_task():
+        # Re-scan market periodically (in case we need to switch)
+        nonlocal feed
+        async for _ in every(60.0):
+            m = await asyncio.to_thread(scanner.get_active_market, True)
+            if m:
+                state.market = m
+                await asyncio.to_thread(manager.cancel_all_orders)
+                if feed:
+                    feed.stop()
+                feed = OrderBookFeed(m.yes_token_id, m.no_token_id)
+                await asyncio.to_thread(feed.start)
+                logger.info("Switched to market: %s", m.question)
+
+    async def strategy_task():
+        # Place symmetrical quotes every strategy_check_interval
+        async for _ in every(strategy_check_interval):
+            # Snapshot the state attributes once per tick; the rescan task
+            # can swap state.market under us between awaits.
+            market = state.market
+            mid = state.mid_price
+            if not market:
+                continue
+            if mid and market.accepting_orders and not state.circuit_breaker:
+                manager.set_last_mid(mid)
+                size = round(POSITION_SIZE_USD / max(mid, 0.1), 2)
+                quotes = strategy.get_quotes(
+                    mid,
+                    market.yes_token_id,
+                    market.no_token_id,
+                    size=min(size, 20),
+                    quote_yes=manager.can_quote("Yes"),
+                    quote_no=manager.can_quote("No"),
+                )
+                for q in quotes:
+                    # Enqueue-only: the manager's dispatch worker does the
+                    # blocking CLOB calls, so no to_thread hop is needed.
+                    placed = manager.place_post_only_limit_order(
+                        token_id=q.token_id,
+                        side=q.side,
+                        price=q.price,
+                        size=q.size,
+                        outcome=q.outcome,
+                    )
+                    if placed:
+                        analytics.log_order_placed(
+                            market.market_id,
+                            q.outcome,
+                            q.price,
+                            q.size,
                         )
-                        for q in quotes:
-                            placed = manager.place_post_only_limit_order(
-                                token_id=q.token_id,
-                                side=q.side,
-                                price=q.price,
-                                size=q.size,
-                                outcome=q.outcome,
-                            )
-                            if placed:
-                                analytics.log_order_placed(
-                                    state.market.market_id,
-                                    q.outcome,
-                                    q.price,
-                                    q.size,
-                                )
-
-                # Poll for fills (best-effort)
-                if int(now) % 30 == 0 and state.market:
-                    try:
-                        trades = client.get_trades()
-                        for t in (trades or [])[:20]:
-                            tid = t.get("id") or t.get("trade_id") or str(t)
-                            if tid and tid not in last_trade_ids:
-                                last_trade_ids.add(tid)
-                                if len(last_trade_ids) > 500:
-                                    last_trade_ids.clear()
-                                aid = str(t.get("asset_id") or t.get("token_id") or "")
-                                outcome = "Yes" if aid == state.market.yes_token_id else "No"
-                                price = float(t.get("price", 0) or 0)
-                                size = float(t.get("size", t.get("amount", 0)) or 0)
-                                if price > 0 and size > 0:
-                                    analytics.log_passive_fill(state.market.market_id, outcome, price, size)
-                                    manager.record_fill(outcome, size, price)
-                    except Exception as e:
-                        logger.debug("Trade poll: %s", e)
-
-                if int(now) % 30 < 1:
-                    update_balances()
 
+    async def trade_poll_task():
+        # Poll for fills (best-effort)
+        async for _ in every(30.0):
+            market = state.market
+            if not market:
+                continue
+            yes_token_id = market.yes_token_id
+            market_id = market.market_id
+            try:
+                trades = await asyncio.to_thread(client.get_trades)
+                for t in (trades or [])[:20]:
+                    get = t.get
+                    tid = get("id") or get("trade_id") or str(t)
+                    if not tid:
+                        continue
+                    if tid in last_trade_ids:
+                        last_trade_ids.move_to_end(tid)
+                        continue
+                    last_trade_ids[tid] = None
+                    if len(last_trade_ids) > 1024:
+                        last_trade_ids.popitem(last=False)
+                    aid = str(get("asset_id") or get("token_id") or "")
+                    outcome = "Yes" if aid == yes_token_id else "No"
+                    price = float(get("price", 0) or 0)
+                    size = float(get("size", get("amount", 0)) or 0)
+                    if price > 0 and size > 0:
+                        analytics.log_passive_fill(market_id, outcome, price, size)
+                        manager.record_fill(outcome, size, price)
+            except Exception as e:
+                logger.debug("Trade poll: %s", e)
+
+    async def balance_task():
+        async for _ in every(balance_refresh_interval):
+            await asyncio.to_thread(update_balances)
+
+    async def render_task(live: Live):
+        nonlocal last_pnl_sample_time
+        async for _ in every(dashboard_refresh):
+            now = time.monotonic()
+
+            if manager.circuit_breaker_tripped:
+                state.circuit_breaker = True
                 live.update(render())
+                stop.set()
+                break
+
+            mid = feed.mid_price
+            pnl = manager.session_pnl
+            state.mid_price = mid
+            state.session_pnl = pnl
 
+            if now - last_pnl_sample_time >= pnl_sample_interval:
+                last_pnl_sample_time = now
+                state.pnl_history.append(pnl)
+
+            # Mid-price drift: cancel the resting bids and re-quote
+            if mid is not None and manager.should_requote(mid):
+                await asyncio.to_thread(manager.cancel_active_bids)
+                manager.set_last_mid(mid)
+                logger.info("Mid drifted, re-quoting at %.3f", mid)
+
+            live.update(render())
+
+    async def main_async():
+        nonlocal stop
+        stop = asyncio.Event()
+        with Live(render(), console=console, refresh_per_second=2) as live:
+            tasks = [
+                asyncio.create_task(render_task(live)),
+                asyncio.create_task(strategy_task()),
+                asyncio.create_task(rescan_task()),
+                asyncio.create_task(trade_poll_task()),
+                asyncio.create_task(balance_task()),
+            ]
+            await stop.wait()
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if state.circuit_breaker:
+            console.print("[bold red]CIRCUIT BREAKER: Bot stopped.[/bold red]")
+
+    try:
+        asyncio.run(main_async())
     except KeyboardInterrupt:
         console.print("\n[yellow]Shutting down...[/yellow]")
     finally:
         if feed:
             feed.stop()
         manager.cancel_all_orders()
+        analytics.close()
 
 
 if __name__ == "__main__":
@@ -2,9 +2,10 @@
 Live-updating Rich terminal dashboard for Market Making bot.
 """
 
+import functools
 import time
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Iterable, Optional
 
 from rich.console import Console
 from rich.live import Live
@@ -18,35 +19,55 @@ _SPARK_CHARS = "▁▂▃▄▅▆▇█"
 _SPARK_WIDTH = 24
 
 
-def _pnl_to_sparkline(values: List[float]) -> str:
-    if not values:
+# P&L only moves every ~10s while the dashboard renders at 2 Hz, so cache
+# the rendered sparkline keyed by the sample tuple and skip the loop on
+# unchanged frames.
+_spark_cache_key: Optional[tuple] = None
+_spark_cache_val = "—"
+
+
+def _pnl_to_sparkline(values) -> str:
+    """Accepts any iterable of floats (the bot passes its deque directly)."""
+    global _spark_cache_key, _spark_cache_val
+    key = tuple(values)
+    if not key:
         return "—"
-    vmin = min(values)
-    vmax = max(values)
+    if key == _spark_cache_key:
+        return _spark_cache_val
+    vmin = min(key)
+    vmax = max(key)
     span = vmax - vmin if vmax != vmin else 1.0
+    scale = (len(_SPARK_CHARS) - 1) / span
+    last = len(_SPARK_CHARS) - 1
     chars = []
-    for v in values[-_SPARK_WIDTH:]:
-        idx = int((v - vmin) / span * (len(_SPARK_CHARS) - 1))
-        idx = max(0, min(idx, len(_SPARK_CHARS) - 1))
-        chars.append(_SPARK_CHARS[idx])
-    return "".join(chars)
+    for v in key[-_SPARK_WIDTH:]:
+        idx = int((v - vmin) * scale)
+        chars.append(_SPARK_CHARS[idx if 0 <= idx <= last else (0 if idx < 0 else last)])
+    _spark_cache_key = key
+    _spark_cache_val = "".join(chars)
+    return _spark_cache_val
+
+
+# end_date_iso only changes on market switch; cache the parsed timestamp so
+# the 2 Hz render path does integer math instead of an ISO parse per frame.
+@functools.lru_cache(maxsize=8)
+def _parse_end_iso(end_iso: str) -> float:
+    end = datetime.fromisoformat(end_iso.replace("Z", "+00:00"))
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    return end.timestamp()
 
 
 def format_time_left(end_iso: str) -> str:
     if not end_iso:
         return "N/A"
     try:
-        s = end_iso.replace("Z", "+00:00")
-        end = datetime.fromisoformat(s)
-        if end.tzinfo:
-            end = end.replace(tzinfo=None)
-        now = datetime.utcnow()
+        delta = _parse_end_iso(end_iso) - time.time()
     except Exception:
         return end_iso
-    delta = end - now
-    if delta.total_seconds() <= 0:
+    if delta <= 0:
         return "Ended"
-    s = int(delta.total_seconds())
+    s = int(delta)
     m, s = divmod(s, 60)
     h, m = divmod(m, 60)
     return f"{h}h {m}m {s}s"
@@ -64,7 +85,7 @@ def create_dashboard(
     usdc_balance: Optional[float],
     pol_balance: Optional[float],
     circuit_breaker: bool,
-    pnl_history: Optional[List[float]] = None,
+    pnl_history: Optional[Iterable[float]] = None,
 ):
     """Build the dashboard panel."""
     status = "[bold red]CIRCUIT BREAKER ACTIVE" if circuit_breaker else "[green]RUNNING"
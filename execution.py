@@ -3,8 +3,10 @@ Execution module: Order Manager, inventory limits, cancel_all, circuit breaker.
 """
 
 import logging
-from datetime import datetime
-from typing import Optional
+import queue
+import threading
+import time
+from typing import NamedTuple, Optional
 
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import OrderArgs, OrderType
@@ -20,12 +22,41 @@ from config import (
 logger = logging.getLogger(__name__)
 
 
+class ActiveBid(NamedTuple):
+    """A resting post-only bid tracked by the manager."""
+
+    price: float
+    size: float
+    order_id: str = ""
+
+
 class OrderManager:
     """
     Order Manager with inventory management and mid-price drift detection.
     Re-quotes when mid_price drifts > threshold. Enforces inventory limits.
     """
 
+    __slots__ = (
+        "client",
+        "position_size_usd",
+        "circuit_breaker_loss_usd",
+        "_neg_threshold",
+        "max_inventory_yes",
+        "max_inventory_no",
+        "_max_inventory",
+        "mid_drift_threshold",
+        "_session_pnl",
+        "_daily_pnl",
+        "_daily_reset_day",
+        "_circuit_breaker_tripped",
+        "_inventory",
+        "_last_mid_price",
+        "_active_yes_bid",
+        "_active_no_bid",
+        "_order_q",
+        "_order_thread",
+    )
+
     def __init__(
         self,
         client: ClobClient,
@@ -34,43 +65,58 @@ class OrderManager:
         max_inventory_yes: int = MAX_INVENTORY_YES,
         max_inventory_no: int = MAX_INVENTORY_NO,
         mid_drift_threshold: float = MID_PRICE_DRIFT_THRESHOLD,
-    ):
+    ) -> None:
         self.client = client
         self.position_size_usd = position_size_usd
         self.circuit_breaker_loss_usd = circuit_breaker_loss_usd
+        # Trip threshold with the sign baked in, so the hot compare in
+        # record_pnl is a plain <= against a constant.
+        self._neg_threshold: float = -circuit_breaker_loss_usd
         self.max_inventory_yes = max_inventory_yes
         self.max_inventory_no = max_inventory_no
+        self._max_inventory: dict[str, float] = {"Yes": float(max_inventory_yes), "No": float(max_inventory_no)}
         self.mid_drift_threshold = mid_drift_threshold
         self._session_pnl: float = 0.0
         self._daily_pnl: float = 0.0
-        self._daily_reset_date: Optional[datetime] = None
-        self._circuit_breaker_tripped = False
-        self._inventory_yes: float = 0.0
-        self._inventory_no: float = 0.0
+        self._daily_reset_day: int = int(time.time() // 86400)
+        self._circuit_breaker_tripped: bool = False
+        self._inventory: dict[str, float] = {"Yes": 0.0, "No": 0.0}
         self._last_mid_price: Optional[float] = None
-        self._active_yes_bid: Optional[tuple[float, float]] = None  # (price, size)
-        self._active_no_bid: Optional[tuple[float, float]] = None
+        self._active_yes_bid: Optional[ActiveBid] = None
+        self._active_no_bid: Optional[ActiveBid] = None
+        # Orders are dispatched from a worker thread so the caller never
+        # blocks on the CLOB round-trip; the queue is small on purpose —
+        # stale quotes are worthless, so on overflow the oldest is dropped.
+        self._order_q: queue.Queue = queue.Queue(maxsize=8)
+        self._order_thread = threading.Thread(target=self._order_worker, daemon=True)
+        self._order_thread.start()
 
-    def _reset_daily_if_needed(self):
-        today = datetime.utcnow().date()
-        if self._daily_reset_date is None or self._daily_reset_date != today:
+    def _reset_daily_if_needed(self) -> None:
+        today = int(time.time() // 86400)
+        if today != self._daily_reset_day:
             self._daily_pnl = 0.0
-            self._daily_reset_date = today
+            self._daily_reset_day = today
 
-    def record_pnl(self, pnl: float):
+    def record_pnl(self, pnl: float) -> None:
         self._session_pnl += pnl
-        self._reset_daily_if_needed()
+        # Day check inlined: record_pnl runs per fill, so skip the call.
+        today = int(time.time() // 86400)
+        if today != self._daily_reset_day:
+            self._daily_pnl = 0.0
+            self._daily_reset_day = today
         self._daily_pnl += pnl
-        if self._daily_pnl <= -self.circuit_breaker_loss_usd:
+        if self._daily_pnl <= self._neg_threshold:
             self._circuit_breaker_tripped = True
             logger.critical("CIRCUIT BREAKER: Daily P&L %.2f <= -%.2f. Bot STOPPED.", self._daily_pnl, self.circuit_breaker_loss_usd)
 
-    def record_fill(self, outcome: str, size: float, price: float):
-        """Record a fill to update inventory."""
-        if outcome == "Yes":
-            self._inventory_yes += size
-        else:
-            self._inventory_no += size
+    def record_fill(self, outcome: str, size: float, price: float) -> None:
+        """Record a fill: update inventory and mark the fill against last mid."""
+        self._inventory[outcome] += size
+        mid = self._last_mid_price
+        if mid is not None:
+            # Value the fill at the side's own mid (No trades at 1 - yes_mid).
+            side_mid = mid if outcome == "Yes" else 1.0 - mid
+            self.record_pnl((side_mid - price) * size)
 
     @property
     def circuit_breaker_tripped(self) -> bool:
@@ -87,18 +133,18 @@ class OrderManager:
 
     @property
     def inventory_yes(self) -> float:
-        return self._inventory_yes
+        return self._inventory["Yes"]
 
     @property
     def inventory_no(self) -> float:
-        return self._inventory_no
+        return self._inventory["No"]
 
     @property
-    def active_yes_bid(self) -> Optional[tuple[float, float]]:
+    def active_yes_bid(self) -> Optional[ActiveBid]:
         return self._active_yes_bid
 
     @property
-    def active_no_bid(self) -> Optional[tuple[float, float]]:
+    def active_no_bid(self) -> Optional[ActiveBid]:
         return self._active_no_bid
 
     def should_requote(self, current_mid: float) -> bool:
@@ -107,14 +153,46 @@ class OrderManager:
             return True
         return abs(current_mid - self._last_mid_price) > self.mid_drift_threshold
 
-    def set_last_mid(self, mid: float):
+    def set_last_mid(self, mid: float) -> None:
         self._last_mid_price = mid
 
-    def can_quote_yes(self) -> bool:
-        return self._inventory_yes < self.max_inventory_yes
+    def can_quote(self, outcome: str) -> bool:
+        """True if the side's inventory is below its limit."""
+        return self._inventory[outcome] < self._max_inventory[outcome]
+
+    def cancel_side(self, outcome: str) -> None:
+        """Cancel only the resting bid on one side via its order id."""
+        bid = self._active_yes_bid if outcome == "Yes" else self._active_no_bid
+        if bid is None:
+            return
+        order_id = bid.order_id
+        if not order_id:
+            # No id captured (older server response shape); blanket cancel.
+            self.cancel_all_orders()
+            return
+        try:
+            self.client.cancel(order_id=order_id)
+            self.clear_active_bid(outcome)
+            logger.info("Canceled %s bid %s", outcome, order_id)
+        except Exception as e:
+            logger.exception("cancel %s failed: %s", outcome, e)
+
+    def cancel_active_bids(self) -> None:
+        """Cancel the tracked resting bids with targeted cancels.
 
-    def can_quote_no(self) -> bool:
-        return self._inventory_no < self.max_inventory_no
+        Cheaper than cancel_all when only one side is resting (the common
+        case once an inventory limit pauses the other side), and it never
+        touches orders this manager doesn't know about.
+        """
+        if self._active_yes_bid is None and self._active_no_bid is None:
+            return
+        if (self._active_yes_bid and not self._active_yes_bid.order_id) or (
+            self._active_no_bid and not self._active_no_bid.order_id
+        ):
+            self.cancel_all_orders()
+            return
+        for outcome in ("Yes", "No"):
+            self.cancel_side(outcome)
 
     def cancel_all_orders(self) -> None:
         """Cancel all open orders."""
@@ -128,6 +206,14 @@ class OrderManager:
         except Exception as e:
             logger.exception("cancel_all failed: %s", e)
 
+    def _order_worker(self) -> None:
+        """Drain queued orders, doing the blocking CLOB calls off-thread."""
+        while True:
+            job = self._order_q.get()
+            if job is None:
+                return
+            self._execute_order(*job)
+
     def place_post_only_limit_order(
         self,
         token_id: str,
@@ -135,6 +221,37 @@ class OrderManager:
         price: float,
         size: float,
         outcome: str = "",
+    ) -> bool:
+        """Enqueue a post-only limit order. Returns True if queued.
+
+        The actual create_order/post_order round-trip happens on the
+        dispatch worker; if the queue is full the oldest pending order is
+        dropped in favor of this (fresher) one.
+        """
+        if self._circuit_breaker_tripped:
+            return False
+        job = (token_id, side, price, size, outcome)
+        try:
+            self._order_q.put_nowait(job)
+        except queue.Full:
+            try:
+                dropped = self._order_q.get_nowait()
+                logger.warning("Order queue full, dropped stale order: %s", dropped)
+            except queue.Empty:
+                pass
+            try:
+                self._order_q.put_nowait(job)
+            except queue.Full:
+                return False
+        return True
+
+    def _execute_order(
+        self,
+        token_id: str,
+        side: str,
+        price: float,
+        size: float,
+        outcome: str = "",
     ) -> bool:
         """Place post-only limit order. Returns True if submitted."""
         if self._circuit_breaker_tripped:
@@ -142,18 +259,21 @@ class OrderManager:
         try:
             order_args = OrderArgs(token_id=token_id, price=price, size=size, side=side)
             order = self.client.create_order(order_args)
-            self.client.post_order(order, orderType=OrderType.GTC, post_only=True)
+            resp = self.client.post_order(order, orderType=OrderType.GTC, post_only=True)
+            order_id = ""
+            if isinstance(resp, dict):
+                order_id = str(resp.get("orderID") or resp.get("orderId") or resp.get("id") or "")
             if outcome == "Yes":
-                self._active_yes_bid = (price, size)
+                self._active_yes_bid = ActiveBid(price, size, order_id)
             elif outcome == "No":
-                self._active_no_bid = (price, size)
+                self._active_no_bid = ActiveBid(price, size, order_id)
             logger.info("Posted post-only %s @ %.3f x %.2f", side, price, size)
             return True
         except Exception as e:
             logger.warning("Order failed: %s", e)
             return False
 
-    def clear_active_bid(self, outcome: str):
+    def clear_active_bid(self, outcome: str) -> None:
         if outcome == "Yes":
             self._active_yes_bid = None
         elif outcome == "No":
@@ -3,9 +3,12 @@ Application logging for headless server runs.
 Writes system events to bot_system.log, separate from terminal UI.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 LOG_FILE = "bot_system.log"
@@ -23,6 +26,10 @@ def setup_logging(
     Configure Python logging:
     - Console: INFO (terminal output)
     - File: DEBUG (full system events for headless debugging)
+
+    Handlers live behind a QueueHandler/QueueListener pair: a logging call
+    on a hot path (WS callbacks, order placement) only enqueues the record;
+    formatting and file/stdout I/O happen on the listener's own thread.
     """
     root = logging.getLogger()
     if root.handlers:
@@ -35,13 +42,19 @@ def setup_logging(
     file_handler = logging.FileHandler(log_path, encoding="utf-8")
     file_handler.setLevel(file_level)
     file_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
-    root.addHandler(file_handler)
 
     # Console handler (terminal UI)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(console_level)
     console_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
-    root.addHandler(console_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
 
 
 def get_logger(name: str) -> logging.Logger:
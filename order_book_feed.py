@@ -3,8 +3,12 @@ Polymarket Order Book WebSocket feed.
 Provides real-time best bid/ask and mid_price for market making.
 """
 
+import array
 import json
 import logging
+import math
+import random
+import socket
 import threading
 import time
 from typing import Callable, Optional
@@ -13,6 +17,16 @@ import websocket
 
 from config import POLYMARKET_WS_URL
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 logger = logging.getLogger(__name__)
 
 PING_INTERVAL = 10
@@ -20,6 +34,15 @@ BACKOFF_BASE = 1.0
 BACKOFF_MAX = 60.0
 BACKOFF_MULT = 2.0
 
+# Disable Nagle so small book frames aren't coalesced, and widen the
+# receive buffer so tick bursts don't backpressure the TLS layer.
+_SOCKOPTS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20),
+]
+if hasattr(socket, "TCP_QUICKACK"):
+    _SOCKOPTS.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+
 
 class OrderBookFeed:
     """
@@ -35,98 +58,136 @@ class OrderBookFeed:
     ):
         self._yes_token_id = yes_token_id
         self._no_token_id = no_token_id
+        # The subscription payload is fixed per token pair; serialize it
+        # once here instead of on every (re)connect.
+        self._sub_frame = _dumps({
+            "assets_ids": [yes_token_id, no_token_id],
+            "type": "market",
+            "custom_feature_enabled": True,
+        })
         self._on_mid_price = on_mid_price
-        self._best_bid: Optional[float] = None
-        self._best_ask: Optional[float] = None
-        self._mid_price: Optional[float] = None
+        # (best_bid, best_ask, mid) as three contiguous C doubles: steady-
+        # state updates overwrite in place instead of rebinding boxed floats
+        # on every tick. NaN marks "no price yet".
+        self._prices = array.array("d", [math.nan] * 3)
         self._ws: Optional[websocket.WebSocketApp] = None
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._backoff = BACKOFF_BASE
-
-    def _on_message(self, _, message: str):
+        self._first_price = threading.Event()
+        # Callback throttle: book spam can deliver hundreds of near-identical
+        # BBO frames per second. State always reflects the latest frame, but
+        # the callback fires at most every _min_callback_interval and never
+        # for an unchanged (bid, ask) pair.
+        self._min_callback_interval = 0.005
+        self._last_cb_ts = 0.0
+        self._last_cb_key: Optional[tuple] = None
+        # event_type -> bound handler: one dict lookup per message instead
+        # of a string-compare cascade.
+        self._handlers = {
+            "best_bid_ask": self._handle_best_bid_ask,
+            "book": self._handle_book,
+            "price_change": self._handle_price_change,
+        }
+
+    def _on_data(self, _, message, opcode, cont):
+        # With skip_utf8_validation the payload arrives as raw bytes; orjson
+        # parses bytes directly, so the UTF-8 decode pass is skipped entirely.
         try:
-            data = json.loads(message)
+            data = _loads(message)
             if isinstance(data, dict):
                 self._process_message(data)
-        except (json.JSONDecodeError, TypeError) as e:
+        except (ValueError, TypeError) as e:
             logger.debug("OrderBook parse error: %s", e)
 
     def _process_message(self, data: dict):
         """Update best bid/ask from book or best_bid_ask events."""
-        event_type = data.get("event_type")
-
-        if event_type == "best_bid_ask":
-            bid = data.get("best_bid")
-            ask = data.get("best_ask")
-            if bid is not None and ask is not None:
-                self._update_book(float(bid), float(ask))
+        handler = self._handlers.get(data.get("event_type"))
+        if handler is not None:
+            handler(data)
+
+    def _handle_best_bid_ask(self, data: dict):
+        bid = data.get("best_bid")
+        ask = data.get("best_ask")
+        if bid is not None and ask is not None:
+            self._update_book(float(bid), float(ask))
+
+    def _handle_book(self, data: dict):
+        asset_id = str(data.get("asset_id", ""))
+        if asset_id != self._yes_token_id:
             return
-
-        if event_type == "book":
-            asset_id = str(data.get("asset_id", ""))
-            if asset_id != self._yes_token_id:
-                return
-            bids = data.get("bids") or []
-            asks = data.get("asks") or []
-            best_bid = float(bids[0]["price"]) if bids else None
-            best_ask = float(asks[0]["price"]) if asks else None
-            if best_bid is not None and best_ask is not None:
-                self._update_book(best_bid, best_ask)
-            return
-
-        if event_type == "price_change":
-            changes = data.get("price_changes") or []
-            for pc in changes:
-                if str(pc.get("asset_id")) == self._yes_token_id:
-                    bid = pc.get("best_bid")
-                    ask = pc.get("best_ask")
-                    if bid is not None and ask is not None:
-                        try:
-                            b, a = float(bid), float(ask)
-                            if b > 0 and a > 0 and a < 2:
-                                self._update_book(b, a)
-                        except (ValueError, TypeError):
-                            pass
-                    break
+        bids = data.get("bids") or []
+        asks = data.get("asks") or []
+        best_bid = float(bids[0]["price"]) if bids else None
+        best_ask = float(asks[0]["price"]) if asks else None
+        if best_bid is not None and best_ask is not None:
+            self._update_book(best_bid, best_ask)
+
+    def _handle_price_change(self, data: dict):
+        changes = data.get("price_changes") or []
+        for pc in changes:
+            if str(pc.get("asset_id")) == self._yes_token_id:
+                bid = pc.get("best_bid")
+                ask = pc.get("best_ask")
+                if bid is not None and ask is not None:
+                    try:
+                        b, a = float(bid), float(ask)
+                        if b > 0 and a > 0 and a < 2:
+                            self._update_book(b, a)
+                    except (ValueError, TypeError):
+                        pass
+                break
 
     def _update_book(self, best_bid: float, best_ask: float):
         """Update internal state and compute mid."""
-        self._best_bid = best_bid
-        self._best_ask = best_ask
-        self._mid_price = (best_bid + best_ask) / 2.0 if (best_bid and best_ask) else None
+        mid = (best_bid + best_ask) * 0.5 if (best_bid and best_ask) else math.nan
+        p = self._prices
+        p[0] = best_bid
+        p[1] = best_ask
+        p[2] = mid
         self._backoff = BACKOFF_BASE
-        if self._mid_price is not None and self._on_mid_price:
-            self._on_mid_price(self._mid_price, best_bid, best_ask)
+        if not math.isnan(mid):
+            if not self._first_price.is_set():
+                self._first_price.set()
+            if self._on_mid_price:
+                key = (best_bid, best_ask)
+                now = time.monotonic()
+                if key == self._last_cb_key or now - self._last_cb_ts < self._min_callback_interval:
+                    return
+                self._last_cb_key = key
+                self._last_cb_ts = now
+                self._on_mid_price(mid, best_bid, best_ask)
 
     def _run_ws(self):
         while self._running:
             try:
                 self._ws = websocket.WebSocketApp(
                     POLYMARKET_WS_URL,
-                    on_message=self._on_message,
+                    on_data=self._on_data,
                     on_error=lambda _, e: logger.warning("OrderBook WS error: %s", e),
                     on_close=lambda *_: logger.info("OrderBook WS closed"),
                 )
                 self._ws.on_open = self._on_open
-                self._ws.run_forever(ping_interval=PING_INTERVAL, ping_timeout=5)
+                self._ws.run_forever(
+                    ping_interval=PING_INTERVAL,
+                    ping_timeout=5,
+                    sockopt=_SOCKOPTS,
+                    skip_utf8_validation=True,
+                )
             except Exception as e:
                 logger.warning("OrderBook WS exception: %s", e)
             if not self._running:
                 break
-            delay = min(self._backoff, BACKOFF_MAX)
+            # Jitter the backoff so feeds don't reconnect in lockstep when
+            # the gateway bounces every client at once.
+            delay = min(self._backoff, BACKOFF_MAX) * random.uniform(0.5, 1.5)
             logger.info("OrderBook reconnect in %.1fs", delay)
             time.sleep(delay)
             self._backoff = min(self._backoff * BACKOFF_MULT, BACKOFF_MAX)
 
     def _on_open(self, ws):
         """Subscribe to Yes and No tokens."""
-        msg = json.dumps({
-            "assets_ids": [self._yes_token_id, self._no_token_id],
-            "type": "market",
-            "custom_feature_enabled": True,
-        })
-        ws.send(msg)
+        ws.send(self._sub_frame)
 
     def start(self):
         """Start WebSocket feed."""
@@ -135,10 +196,7 @@ class OrderBookFeed:
         self._running = True
         self._thread = threading.Thread(target=self._run_ws, daemon=True)
         self._thread.start()
-        for _ in range(100):
-            if self._mid_price is not None:
-                break
-            time.sleep(0.1)
+        self._first_price.wait(timeout=10.0)
 
     def stop(self):
         """Stop WebSocket feed."""
@@ -153,12 +211,15 @@ class OrderBookFeed:
 
     @property
     def best_bid(self) -> Optional[float]:
-        return self._best_bid
+        v = self._prices[0]
+        return None if math.isnan(v) else v
 
     @property
     def best_ask(self) -> Optional[float]:
-        return self._best_ask
+        v = self._prices[1]
+        return None if math.isnan(v) else v
 
     @property
     def mid_price(self) -> Optional[float]:
-        return self._mid_price
+        v = self._prices[2]
+        return None if math.isnan(v) else v
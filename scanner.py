@@ -4,15 +4,25 @@ Targets high-volume, longer-term markets (Crypto, Pop Culture) with rewards_min_
 Skips short-term 15-minute markets.
 """
 
+import calendar
 import json
 import logging
+import re
+import time
 from dataclasses import dataclass
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 from config import GAMMA_EVENTS_URL, GAMMA_API_URL
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 # Preferred tags for market making (high volume, longer-term)
@@ -21,8 +31,12 @@ PREFERRED_TAG_SLUGS = frozenset({"crypto", "bitcoin", "ethereum", "pop-culture",
 # Title patterns to EXCLUDE (short-term markets)
 EXCLUDE_PATTERNS = ("15-minute", "15 minute", "5-minute", "1-hour", "1 hour", "hourly")
 
+# One multi-pattern scan over the title instead of a Python-level
+# substring loop per pattern (sre's alternation engine does the work in C).
+_EXCLUDE_RE = re.compile("|".join(map(re.escape, EXCLUDE_PATTERNS)))
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActiveMarket:
     """Represents a market with liquidity rewards."""
 
@@ -45,9 +59,24 @@ class Scanner:
 
     POLL_INTERVAL = 60  # seconds
     REQUEST_TIMEOUT = 15
+    RESOLUTION_TTL = 30.0  # seconds to trust a "not resolved yet" answer
 
     def __init__(self):
         self._last_market: Optional[ActiveMarket] = None
+        # Keep-alive session: polls reuse one TCP+TLS connection to the
+        # Gamma API instead of paying the handshake on every request.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.2)),
+        )
+        self._session.headers["Connection"] = "keep-alive"
+        # Resolution cache: a resolved outcome is frozen forever, an
+        # unresolved (None) lookup is reused for RESOLUTION_TTL seconds.
+        self._resolution_cache: dict[str, bool] = {}
+        self._resolution_none_ts: dict[str, float] = {}
+        # endDate strings repeat across polls; parse each one once.
+        self._end_epoch_cache: dict[str, int] = {}
 
     def _fetch_events(self, limit: int = 100, order: str = "volume_24hr") -> list:
         """Fetch active events from Gamma API, sorted by volume."""
@@ -59,9 +88,9 @@ class Scanner:
             "ascending": "false",
         }
         try:
-            r = requests.get(GAMMA_EVENTS_URL, params=params, timeout=self.REQUEST_TIMEOUT)
+            r = self._session.get(GAMMA_EVENTS_URL, params=params, timeout=self.REQUEST_TIMEOUT)
             r.raise_for_status()
-            data = r.json()
+            data = _loads(r.content)
             return data if isinstance(data, list) else []
         except requests.RequestException as e:
             logger.warning("Gamma API request failed: %s", e)
@@ -70,19 +99,30 @@ class Scanner:
     def _parse_clob_token_ids(self, raw: str) -> tuple[str, str]:
         """Parse clobTokenIds JSON string. Returns (yes_token_id, no_token_id)."""
         try:
-            ids = json.loads(raw)
+            ids = _loads(raw)
             if isinstance(ids, list) and len(ids) >= 2:
                 return str(ids[0]), str(ids[1])
-        except (json.JSONDecodeError, TypeError):
+        except (ValueError, TypeError):
             pass
         return "", ""
 
+    def _end_epoch(self, end_iso: str) -> int:
+        """Epoch seconds for an ISO endDate, memoized. 0 if unparseable."""
+        epoch = self._end_epoch_cache.get(end_iso)
+        if epoch is None:
+            try:
+                epoch = calendar.timegm(time.strptime(end_iso[:19], "%Y-%m-%dT%H:%M:%S"))
+            except ValueError:
+                epoch = 0
+            self._end_epoch_cache[end_iso] = epoch
+        return epoch
+
     def _is_short_term(self, event: dict, market: dict) -> bool:
         """Return True if market is short-term (15-min, hourly, etc.)."""
         title = (event.get("title") or "").lower()
         question = (market.get("question") or "").lower()
         combined = f"{title} {question}"
-        return any(p in combined for p in EXCLUDE_PATTERNS)
+        return _EXCLUDE_RE.search(combined) is not None
 
     def _has_preferred_tag(self, event: dict) -> bool:
         """Check if event has a preferred tag (Crypto, Pop Culture, etc.)."""
@@ -102,13 +142,16 @@ class Scanner:
             score += 10.0
         return score
 
-    def get_active_market(self) -> Optional[ActiveMarket]:
+    def get_active_market(self, only_if_changed: bool = False) -> Optional[ActiveMarket]:
         """
         Get the best market with liquidity rewards.
         Filters: rewards_min_size > 0, accepting orders, not short-term.
+        With only_if_changed=True, returns None when the winner is the same
+        market as last time, so callers can skip the no-op switch path.
         """
         events = self._fetch_events(limit=150)
-        best: Optional[tuple[float, dict, dict]] = None
+        best: Optional[tuple[float, dict, dict, str, str, int]] = None
+        now_epoch = time.time()
 
         for event in events:
             if not event.get("active") or event.get("closed"):
@@ -124,6 +167,11 @@ class Scanner:
                     continue
                 if m.get("closed") or not m.get("acceptingOrders", True):
                     continue
+                end_iso = str(m.get("endDate") or m.get("endDateIso") or "")
+                if end_iso:
+                    end_epoch = self._end_epoch(end_iso)
+                    if end_epoch and end_epoch < now_epoch:
+                        continue  # already ended, whatever the flags say
                 if self._is_short_term(event, m):
                     continue
                 yes_id, no_id = self._parse_clob_token_ids(m.get("clobTokenIds") or "[]")
@@ -132,14 +180,17 @@ class Scanner:
 
                 score = self._score_market(event, m)
                 if best is None or score > best[0]:
-                    best = (score, event, m)
+                    # Carry the already-parsed fields so the winner isn't
+                    # re-parsed after the loop.
+                    best = (score, event, m, yes_id, no_id, rewards_min)
 
         if best is None:
             return None
 
-        _, event, m = best
-        yes_id, no_id = self._parse_clob_token_ids(m.get("clobTokenIds") or "[]")
-        rewards_min = int(m.get("rewardsMinSize") or 0)
+        _, event, m, yes_id, no_id, rewards_min = best
+        if only_if_changed and self._last_market is not None:
+            if str(m.get("id", "")) == self._last_market.market_id:
+                return None
 
         market = ActiveMarket(
             event_id=str(event.get("id", "")),
@@ -156,23 +207,38 @@ class Scanner:
         return market
 
     def get_market_resolution(self, market_id: str) -> Optional[bool]:
-        """Fetch resolved market from Gamma API. Returns True if Yes won, False if No won."""
+        """Fetch resolved market from Gamma API. Returns True if Yes won, False if No won.
+
+        Results are cached: markets never un-resolve, so a non-None answer
+        is served from memory forever, and a None answer suppresses repeat
+        lookups for RESOLUTION_TTL seconds.
+        """
+        cached = self._resolution_cache.get(market_id)
+        if cached is not None:
+            return cached
+        none_ts = self._resolution_none_ts.get(market_id)
+        if none_ts is not None and time.monotonic() - none_ts < self.RESOLUTION_TTL:
+            return None
         url = f"{GAMMA_API_URL}/markets/{market_id}"
         try:
-            r = requests.get(url, timeout=self.REQUEST_TIMEOUT)
+            r = self._session.get(url, timeout=self.REQUEST_TIMEOUT)
             r.raise_for_status()
-            m = r.json()
-            if not m.get("closed"):
-                return None
-            raw = m.get("outcomePrices") or m.get("outcomes")
-            if isinstance(raw, str):
-                prices = json.loads(raw) if raw.startswith("[") else [raw]
-            else:
-                prices = raw or []
-            if len(prices) >= 2:
-                yes_price = float(prices[0]) if isinstance(prices[0], (int, float)) else float(str(prices[0]))
-                return yes_price > 0.5
+            m = _loads(r.content)
+            if m.get("closed"):
+                raw = m.get("outcomePrices") or m.get("outcomes")
+                if isinstance(raw, str):
+                    prices = json.loads(raw) if raw.startswith("[") else [raw]
+                else:
+                    prices = raw or []
+                if len(prices) >= 2:
+                    # float() takes str/int/float directly; no str() detour.
+                    result = float(prices[0]) > 0.5
+                    self._resolution_cache[market_id] = result
+                    self._resolution_none_ts.pop(market_id, None)
+                    return result
+            self._resolution_none_ts[market_id] = time.monotonic()
             return None
         except Exception as e:
             logger.warning("Could not fetch market resolution for %s: %s", market_id, e)
+            self._resolution_none_ts[market_id] = time.monotonic()
             return None
@@ -4,16 +4,24 @@ Symmetrical Post-Only Limit Orders on both sides of the book.
 Yes bid at mid_price - target_spread, No bid at (1 - mid_price) - target_spread.
 """
 
-import logging
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence
 
 from config import TARGET_SPREAD
 
-logger = logging.getLogger(__name__)
+# Shared empty result for rejected ticks: no list allocation on the
+# no-quote path.
+_NO_QUOTES: tuple = ()
 
+# Interned once so every signal shares the same string objects and
+# downstream equality checks are pointer compares.
+_BUY = sys.intern("BUY")
+_YES = sys.intern("Yes")
+_NO = sys.intern("No")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class QuoteSignal:
     """Signal to place a post-only bid on Yes or No."""
 
@@ -24,6 +32,28 @@ class QuoteSignal:
     size: float
 
 
+def _compute_bids(mid_price: float, spread_ticks: int) -> tuple[bool, float, bool, float]:
+    """Pure arithmetic core: (yes_ok, yes_bid, no_ok, no_bid).
+
+    Works in integer ticks (1 tick = 0.001, the Polymarket price grid):
+    one int conversion replaces two round() calls, the range checks are
+    integer compares, and prices convert back to floats only on the way
+    out. Kept free of object construction and attribute access so it can
+    be handed to a JIT/AOT compiler wholesale if rates ever warrant it.
+    """
+    mid_ticks = int(mid_price * 1000.0 + 0.5)
+    yes_ticks = mid_ticks - spread_ticks
+    no_ticks = 1000 - mid_ticks - spread_ticks
+    # Division (not * 0.001) gives the correctly-rounded double, matching
+    # what round(x, 3) produced, so serialized prices stay clean.
+    return (
+        10 <= yes_ticks <= 990,
+        yes_ticks / 1000.0,
+        10 <= no_ticks <= 990,
+        no_ticks / 1000.0,
+    )
+
+
 class MarketMakerStrategy:
     """
     Calculates symmetrical quotes around mid_price.
@@ -32,6 +62,8 @@ class MarketMakerStrategy:
 
     def __init__(self, target_spread: float = TARGET_SPREAD):
         self.target_spread = target_spread
+        # Spread on the 0.001 price grid, converted once.
+        self._spread_ticks = int(round(target_spread * 1000))
 
     def get_quotes(
         self,
@@ -41,31 +73,63 @@ class MarketMakerStrategy:
         size: float,
         quote_yes: bool = True,
         quote_no: bool = True,
-    ) -> list["QuoteSignal"]:
+    ) -> Sequence["QuoteSignal"]:
         """
-        Return list of QuoteSignals for symmetrical bids.
+        Return QuoteSignals for symmetrical bids (empty when nothing to quote).
         quote_yes/quote_no: set False if inventory limit reached on that side.
         """
-        if mid_price <= 0 or mid_price >= 1:
-            return []
+        # Reject before any arithmetic: both sides disabled, mid out of
+        # range, or size below the exchange minimum.
+        if (
+            (not quote_yes and not quote_no)
+            or mid_price <= 0.0
+            or mid_price >= 1.0
+            or size < 1
+        ):
+            return _NO_QUOTES
         signals = []
-        yes_bid = round(mid_price - self.target_spread, 3)
-        no_bid = round((1.0 - mid_price) - self.target_spread, 3)
+        yes_ok, yes_bid, no_ok, no_bid = _compute_bids(mid_price, self._spread_ticks)
 
-        if quote_yes and 0.01 <= yes_bid <= 0.99 and size >= 1:
+        if quote_yes and yes_ok:
             signals.append(QuoteSignal(
                 token_id=yes_token_id,
-                side="BUY",
-                outcome="Yes",
+                side=_BUY,
+                outcome=_YES,
                 price=yes_bid,
                 size=size,
             ))
-        if quote_no and 0.01 <= no_bid <= 0.99 and size >= 1:
+        if quote_no and no_ok:
             signals.append(QuoteSignal(
                 token_id=no_token_id,
-                side="BUY",
-                outcome="No",
+                side=_BUY,
+                outcome=_NO,
                 price=no_bid,
                 size=size,
             ))
         return signals
+
+    def get_quotes_batch(
+        self,
+        mid_prices,
+        yes_token_ids,
+        no_token_ids,
+        sizes,
+        quote_yes_flags=None,
+        quote_no_flags=None,
+    ) -> list["QuoteSignal"]:
+        """
+        Quote several markets in one call; parallel sequences, one entry
+        per market. Flags default to quoting both sides everywhere.
+        """
+        n = len(mid_prices)
+        if quote_yes_flags is None:
+            quote_yes_flags = (True,) * n
+        if quote_no_flags is None:
+            quote_no_flags = (True,) * n
+        signals: list[QuoteSignal] = []
+        get_quotes = self.get_quotes
+        for mid, yes_id, no_id, size, qy, qn in zip(
+            mid_prices, yes_token_ids, no_token_ids, sizes, quote_yes_flags, quote_no_flags
+        ):
+            signals.extend(get_quotes(mid, yes_id, no_id, size, qy, qn))
+        return signals